@@ -2,11 +2,18 @@ import pygame
 import math
 import sys
 import random
+import time
+import logging
+import json
 from pygame.locals import *
 from enum import Enum
+from collections import deque
+from state_feed import StateFeedWriter, INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT
 
 pygame.init()
 
+logger = logging.getLogger(__name__)
+
 class GameState(Enum):
     NOT_STARTED = 0
     RUNNING = 1
@@ -59,6 +66,244 @@ SPEED_CHANGE_STEP = 0.5
 
 DISPLAY_SCALE = 0.27
 
+PLATE_AREA_TOP_MARGIN = 70       
+PLATE_AREA_BOTTOM_MARGIN = 30    
+
+TRAJECTORY_STEPS = 90            
+TRAJECTORY_DOT_SPACING = 5       
+GHOST_COLOR = (0, 160, 255)
+
+ADAPTIVE_DIFFICULTY = False
+SKILL_TIME_CONSTANT = 5.0        
+SKILL_LATENCY_WEIGHT = 0.2       
+SKILL_LATENCY_REFERENCE = 1.0    
+SKILL_EDGE_ZONE = 150            
+SKILL_DRIFT_THRESHOLD = 0.1      
+SKILL_DISTANCE_FACTOR = 0.5
+SKILL_EDGE_FACTOR = 0.3
+SKILL_LATENCY_FACTOR = 0.2
+ADAPTIVE_LEVEL_RATE = 0.02       
+ADAPTIVE_LEVEL_STEP = 0.05       
+SKILL_LOG_INTERVAL = 1.0         
+LOG_SKILL = False
+
+STATE_FEED = False
+
+LAYOUT_CELL_SIZE = 100           
+BUMPER_RESTITUTION = 0.9
+WALL_RESTITUTION = 0.6
+WALL_THICKNESS = 20
+OBSTACLE_COLOR = (150, 150, 150)
+HOLE_COLOR = (255, 140, 0)
+
+MULTI_BALL_COUNT = 1
+BALL_LOSS_FRACTION = 0.0         
+BALL_RESTITUTION = 1.0
+BALL_SPACING = 4                 
+
+def get_plate_forces(plate, current_gravity, current_rolling_resistance):
+    angle_rad = math.radians(plate.tilt_magnitude)
+    direction_rad = math.radians(plate.tilt_direction)
+    
+    sliding_force = current_gravity * math.sin(angle_rad)
+    sliding_ax = sliding_force * math.cos(direction_rad)
+    sliding_ay = sliding_force * math.sin(direction_rad)
+    
+    normal_force = current_gravity * math.cos(angle_rad)
+    resistance_force = current_rolling_resistance * normal_force
+    
+    min_speed = 0
+    if plate.tilt_magnitude > 0.5: 
+        min_speed = plate.tilt_magnitude * 0.015
+    
+    return sliding_ax, sliding_ay, resistance_force, min_speed
+
+def step_ball(x, y, vx, vy, forces, current_max_speed):
+    sliding_ax, sliding_ay, resistance_force, min_speed = forces
+    
+    speed = math.sqrt(vx*vx + vy*vy)
+    
+    ax = sliding_ax
+    ay = sliding_ay
+    
+    if speed > 0:
+        ax += -resistance_force * (vx / speed)
+        ay += -resistance_force * (vy / speed)
+    
+    vx += ax
+    vy += ay
+    
+    new_speed = math.sqrt(vx*vx + vy*vy)
+    if 0 < new_speed < min_speed:
+        scale_factor = min_speed / new_speed
+        vx *= scale_factor
+        vy *= scale_factor
+    
+    new_speed = math.sqrt(vx*vx + vy*vy)
+    if new_speed > current_max_speed:
+        scale = current_max_speed / new_speed
+        vx *= scale
+        vy *= scale
+    
+    return x + vx, y + vy, vx, vy, ax, ay
+
+def is_on_plate(x, y):
+    return math.sqrt(x*x + y*y) <= PLATE_RADIUS - BALL_RADIUS
+
+def bounce(x, y, vx, vy, nx, ny, penetration, restitution):
+    x += nx * penetration
+    y += ny * penetration
+    
+    normal_speed = vx * nx + vy * ny
+    if normal_speed < 0:
+        vx -= (1 + restitution) * normal_speed * nx
+        vy -= (1 + restitution) * normal_speed * ny
+    
+    return x, y, vx, vy
+
+class Bumper:
+    def __init__(self, x, y, radius, restitution=BUMPER_RESTITUTION):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.restitution = restitution
+        
+    def get_bounds(self):
+        reach = self.radius + BALL_RADIUS
+        return self.x - reach, self.y - reach, self.x + reach, self.y + reach
+    
+    def collide(self, x, y, vx, vy):
+        dx = x - self.x
+        dy = y - self.y
+        distance = math.sqrt(dx*dx + dy*dy)
+        reach = self.radius + BALL_RADIUS
+        if distance >= reach:
+            return x, y, vx, vy
+        
+        if distance > 0:
+            nx, ny = dx / distance, dy / distance
+        else:
+            nx, ny = 1.0, 0.0
+        return bounce(x, y, vx, vy, nx, ny, reach - distance, self.restitution)
+    
+    def draw(self, target, center_x, center_y):
+        pygame.draw.circle(target, OBSTACLE_COLOR,
+                           (center_x + int(self.x * DISPLAY_SCALE), center_y + int(self.y * DISPLAY_SCALE)),
+                           max(1, int(self.radius * DISPLAY_SCALE)))
+
+class Wall:
+    def __init__(self, x1, y1, x2, y2, thickness=WALL_THICKNESS, restitution=WALL_RESTITUTION):
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+        self.thickness = thickness
+        self.restitution = restitution
+        
+    def get_bounds(self):
+        reach = self.thickness / 2 + BALL_RADIUS
+        return (min(self.x1, self.x2) - reach, min(self.y1, self.y2) - reach,
+                max(self.x1, self.x2) + reach, max(self.y1, self.y2) + reach)
+    
+    def collide(self, x, y, vx, vy):
+        seg_x = self.x2 - self.x1
+        seg_y = self.y2 - self.y1
+        length_sq = seg_x*seg_x + seg_y*seg_y
+        
+        t = 0
+        if length_sq > 0:
+            t = max(0, min(1, ((x - self.x1) * seg_x + (y - self.y1) * seg_y) / length_sq))
+        
+        dx = x - (self.x1 + t * seg_x)
+        dy = y - (self.y1 + t * seg_y)
+        distance = math.sqrt(dx*dx + dy*dy)
+        reach = self.thickness / 2 + BALL_RADIUS
+        if distance >= reach:
+            return x, y, vx, vy
+        
+        if distance > 0:
+            nx, ny = dx / distance, dy / distance
+        elif length_sq > 0:
+            length = math.sqrt(length_sq)
+            nx, ny = -seg_y / length, seg_x / length
+        else:
+            nx, ny = 1.0, 0.0
+        return bounce(x, y, vx, vy, nx, ny, reach - distance, self.restitution)
+    
+    def draw(self, target, center_x, center_y):
+        pygame.draw.line(target, OBSTACLE_COLOR,
+                         (center_x + int(self.x1 * DISPLAY_SCALE), center_y + int(self.y1 * DISPLAY_SCALE)),
+                         (center_x + int(self.x2 * DISPLAY_SCALE), center_y + int(self.y2 * DISPLAY_SCALE)),
+                         max(1, int(self.thickness * DISPLAY_SCALE)))
+
+class Hole:
+    def __init__(self, x, y, radius):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        
+    def get_bounds(self):
+        return self.x - self.radius, self.y - self.radius, self.x + self.radius, self.y + self.radius
+    
+    def collide(self, x, y, vx, vy):
+        dx = x - self.x
+        dy = y - self.y
+        if dx*dx + dy*dy < self.radius * self.radius:
+            return None
+        return x, y, vx, vy
+    
+    def draw(self, target, center_x, center_y):
+        pygame.draw.circle(target, HOLE_COLOR,
+                           (center_x + int(self.x * DISPLAY_SCALE), center_y + int(self.y * DISPLAY_SCALE)),
+                           max(1, int(self.radius * DISPLAY_SCALE)), 2)
+
+FEATURE_TYPES = {
+    'bumper': Bumper,
+    'wall': Wall,
+    'hole': Hole
+}
+
+class PlateLayout:
+    def __init__(self, features, cell_size=LAYOUT_CELL_SIZE):
+        self.features = features
+        self.cell_size = cell_size
+        self.grid = {}
+        
+        for feature in features:
+            min_x, min_y, max_x, max_y = feature.get_bounds()
+            for cell_x in range(int(min_x // cell_size), int(max_x // cell_size) + 1):
+                for cell_y in range(int(min_y // cell_size), int(max_y // cell_size) + 1):
+                    self.grid.setdefault((cell_x, cell_y), []).append(feature)
+                    
+    def get_nearby(self, x, y):
+        return self.grid.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+    
+    def resolve(self, x, y, vx, vy):
+        for feature in self.get_nearby(x, y):
+            state = feature.collide(x, y, vx, vy)
+            if state is None:
+                return None
+            x, y, vx, vy = state
+        return x, y, vx, vy
+    
+    def draw(self, target, center_x, center_y):
+        for feature in self.features:
+            feature.draw(target, center_x, center_y)
+
+def load_plate_layout(path):
+    with open(path) as f:
+        data = json.load(f)
+    
+    features = []
+    for entry in data.get('features', []):
+        entry = dict(entry)
+        feature_type = entry.pop('type', None)
+        if feature_type not in FEATURE_TYPES:
+            raise ValueError(f"Unknown feature type {feature_type!r} in layout {path}")
+        features.append(FEATURE_TYPES[feature_type](**entry))
+    
+    return PlateLayout(features, data.get('cell_size', LAYOUT_CELL_SIZE))
+
 class Ball:
     def __init__(self, x, y):
         self.reset(x, y)
@@ -72,69 +317,301 @@ class Ball:
         self.ay = 0
         
     def update(self, plate, current_gravity, current_rolling_resistance, current_max_speed):
-        angle_rad = math.radians(plate.tilt_magnitude)
-        direction_rad = math.radians(plate.tilt_direction)
+        forces = get_plate_forces(plate, current_gravity, current_rolling_resistance)
+        return self.advance(forces, current_max_speed, plate.layout)
+    
+    def advance(self, forces, current_max_speed, layout=None):
+        self.x, self.y, self.vx, self.vy, self.ax, self.ay = step_ball(
+            self.x, self.y, self.vx, self.vy, forces, current_max_speed)
         
-        sliding_force = current_gravity * math.sin(angle_rad)
-        sliding_ax = sliding_force * math.cos(direction_rad)
-        sliding_ay = sliding_force * math.sin(direction_rad)
+        if not is_on_plate(self.x, self.y):
+            return False
         
-        normal_force = current_gravity * math.cos(angle_rad)
+        if layout is not None:
+            state = layout.resolve(self.x, self.y, self.vx, self.vy)
+            if state is None:
+                return False
+            self.x, self.y, self.vx, self.vy = state
         
-        speed = math.sqrt(self.vx*self.vx + self.vy*self.vy)
+        return True
+
+    def get_speed(self):
+        return math.sqrt(self.vx * self.vx + self.vy * self.vy)
+
+    def get_distance_from_center(self):
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def get_distance_to_edge(self):
+        return PLATE_RADIUS - self.get_distance_from_center() - BALL_RADIUS
+    
+    def is_in_play(self):
+        return is_on_plate(self.x, self.y)
+
+def collide_balls(a, b):
+    dx = b.x - a.x
+    dy = b.y - a.y
+    distance_sq = dx*dx + dy*dy
+    reach = 2 * BALL_RADIUS
+    if distance_sq >= reach * reach:
+        return
+    
+    distance = math.sqrt(distance_sq)
+    if distance > 0:
+        nx, ny = dx / distance, dy / distance
+    else:
+        nx, ny = 1.0, 0.0
+    
+    push = (reach - distance) / 2
+    a.x -= nx * push
+    a.y -= ny * push
+    b.x += nx * push
+    b.y += ny * push
+    
+    approach_speed = (b.vx - a.vx) * nx + (b.vy - a.vy) * ny
+    if approach_speed < 0:
+        impulse = (1 + BALL_RESTITUTION) / 2 * approach_speed
+        a.vx += impulse * nx
+        a.vy += impulse * ny
+        b.vx -= impulse * nx
+        b.vy -= impulse * ny
+
+NEIGHBOR_CELLS = ((1, 0), (1, 1), (0, 1), (-1, 1))
+
+class BallGroup:
+    def __init__(self, count, loss_fraction=BALL_LOSS_FRACTION, layout=None):
+        if not 0 <= loss_fraction <= 1:
+            raise ValueError(f"Loss fraction must be between 0 and 1, got {loss_fraction}")
         
-        self.ax = sliding_ax
-        self.ay = sliding_ay
+        self.balls = [Ball(0, 0) for _ in range(count)]
+        self.layout = layout
+        self.loss_limit = max(1, math.ceil(loss_fraction * count))
+        self.reset(0, 0)
         
-        if speed > 0:
-            resistance_force = current_rolling_resistance * normal_force
-            
-            resistance_ax = -resistance_force * (self.vx / speed)
-            resistance_ay = -resistance_force * (self.vy / speed)
-            
-            self.ax += resistance_ax
-            self.ay += resistance_ay
+    def reset(self, x, y):
+        spacing = 2 * BALL_RADIUS + BALL_SPACING
+        row_height = spacing * math.sqrt(3) / 2
+        rings = int(PLATE_RADIUS / spacing) + 1
         
-        self.vx += self.ax
-        self.vy += self.ay
+        positions = []
+        for row in range(-rings, rings + 1):
+            offset = spacing / 2 if row % 2 else 0
+            for col in range(-rings, rings + 1):
+                px = col * spacing + offset
+                py = row * row_height
+                if not is_on_plate(x + px, y + py):
+                    continue
+                if self.layout is not None:
+                    state = (x + px, y + py, 0, 0)
+                    if self.layout.resolve(*state) != state:
+                        continue
+                positions.append((px * px + py * py, x + px, y + py))
         
-        new_speed = math.sqrt(self.vx*self.vx + self.vy*self.vy)
+        if len(positions) < len(self.balls):
+            raise ValueError(f"Plate fits at most {len(positions)} balls, got {len(self.balls)}")
         
-        if plate.tilt_magnitude > 0.5: 
-            min_speed = plate.tilt_magnitude * 0.015
-            
-            if 0 < new_speed < min_speed:
-                scale_factor = min_speed / new_speed
-                self.vx *= scale_factor
-                self.vy *= scale_factor
-        
-        new_speed = math.sqrt(self.vx*self.vx + self.vy*self.vy)
-        if new_speed > current_max_speed:
-            scale = current_max_speed / new_speed
-            self.vx *= scale
-            self.vy *= scale
-        
-        self.x += self.vx
-        self.y += self.vy
-        
-        distance = math.sqrt(self.x*self.x + self.y*self.y)
-        if distance > PLATE_RADIUS - BALL_RADIUS:
-            return False
+        positions.sort()
+        for ball, (distance_sq, px, py) in zip(self.balls, positions):
+            ball.reset(px, py)
+        self.active = list(self.balls)
+        self.lost = 0
+        self.tracked = self.balls[0]
         
-        return True
-
+    def update(self, plate, current_gravity, current_rolling_resistance, current_max_speed):
+        forces = get_plate_forces(plate, current_gravity, current_rolling_resistance)
+        
+        survivors = []
+        for ball in self.active:
+            if ball.advance(forces, current_max_speed, plate.layout):
+                survivors.append(ball)
+        
+        self.resolve_collisions(survivors)
+        
+        self.active = [ball for ball in survivors if is_on_plate(ball.x, ball.y)]
+        self.lost = len(self.balls) - len(self.active)
+        if self.active:
+            self.tracked = max(self.active, key=lambda ball: ball.x * ball.x + ball.y * ball.y)
+        else:
+            self.tracked = None
+        
+        return self.lost < self.loss_limit
+    
+    def resolve_collisions(self, balls):
+        cell_size = 2 * BALL_RADIUS
+        grid = {}
+        for ball in balls:
+            grid.setdefault((int(ball.x // cell_size), int(ball.y // cell_size)), []).append(ball)
+        
+        for (cell_x, cell_y), cell in grid.items():
+            for i in range(len(cell)):
+                for j in range(i + 1, len(cell)):
+                    collide_balls(cell[i], cell[j])
+            
+            for dx, dy in NEIGHBOR_CELLS:
+                neighbor = grid.get((cell_x + dx, cell_y + dy))
+                if neighbor is None:
+                    continue
+                for a in cell:
+                    for b in neighbor:
+                        collide_balls(a, b)
+    
+    @property
+    def x(self):
+        return self.tracked.x
+    
+    @property
+    def y(self):
+        return self.tracked.y
+    
+    @property
+    def vx(self):
+        return self.tracked.vx
+    
+    @property
+    def vy(self):
+        return self.tracked.vy
+    
+    @property
+    def ax(self):
+        return self.tracked.ax
+    
+    @property
+    def ay(self):
+        return self.tracked.ay
+    
     def get_speed(self):
-        return math.sqrt(self.vx * self.vx + self.vy * self.vy)
+        return self.tracked.get_speed()
 
     def get_distance_from_center(self):
-        return math.sqrt(self.x * self.x + self.y * self.y)
+        return self.tracked.get_distance_from_center()
 
     def get_distance_to_edge(self):
-        return PLATE_RADIUS - self.get_distance_from_center() - BALL_RADIUS
+        return self.tracked.get_distance_to_edge()
+    
+    def is_in_play(self):
+        return self.tracked is not None
+
+class TrajectoryPredictor:
+    def __init__(self, steps=TRAJECTORY_STEPS):
+        self.steps = steps
+        self.reset()
+        
+    def reset(self):
+        self.key = None
+        self.origin = None
+        self.forces = None
+        self.max_speed = 0
+        self.layout = None
+        self.path = deque()
+        self.exit_frame = None
+        
+    def update(self, plate, ball, current_gravity, current_rolling_resistance, current_max_speed):
+        key = (plate.tilt_magnitude, plate.tilt_direction,
+               current_gravity, current_rolling_resistance, current_max_speed)
+        state = (ball.x, ball.y, ball.vx, ball.vy)
+        
+        if key == self.key:
+            if state == self.origin:
+                return
+            if self.path and state == self.path[0]:
+                self.origin = self.path.popleft()
+                if self.exit_frame is not None:
+                    self.exit_frame -= 1
+                else:
+                    self.extend(1)
+                return
+        
+        self.key = key
+        self.origin = state
+        self.forces = get_plate_forces(plate, current_gravity, current_rolling_resistance)
+        self.max_speed = current_max_speed
+        self.layout = plate.layout
+        self.path.clear()
+        self.exit_frame = None
+        self.extend(self.steps)
+        
+    def extend(self, count):
+        x, y, vx, vy = self.path[-1] if self.path else self.origin
+        for _ in range(count):
+            x, y, vx, vy, ax, ay = step_ball(x, y, vx, vy, self.forces, self.max_speed)
+            on_plate = is_on_plate(x, y)
+            if on_plate and self.layout is not None:
+                state = self.layout.resolve(x, y, vx, vy)
+                if state is None:
+                    on_plate = False
+                else:
+                    x, y, vx, vy = state
+            self.path.append((x, y, vx, vy))
+            if not on_plate:
+                self.exit_frame = len(self.path)
+                break
+
+class SkillEstimator:
+    def __init__(self):
+        self.reset()
+        
+    def reset(self):
+        self.mean_distance = 0
+        self.edge_time = 0
+        self.correction_latency = 0
+        self.corrections = 0
+        self.drift_time = None
+        self.prev_x_tilt = None
+        self.prev_y_tilt = None
+        
+    def update(self, plate, ball, dt):
+        if self.prev_x_tilt is None or dt <= 0:
+            self.prev_x_tilt = plate.x_tilt
+            self.prev_y_tilt = plate.y_tilt
+            return
+        
+        alpha = 1 - math.exp(-dt / SKILL_TIME_CONSTANT)
+        
+        distance = ball.get_distance_from_center() / (PLATE_RADIUS - BALL_RADIUS)
+        self.mean_distance += alpha * (distance - self.mean_distance)
+        
+        near_edge = 1.0 if ball.get_distance_to_edge() < SKILL_EDGE_ZONE else 0.0
+        self.edge_time += alpha * (near_edge - self.edge_time)
+        
+        input_x = plate.x_tilt - self.prev_x_tilt
+        input_y = plate.y_tilt - self.prev_y_tilt
+        self.prev_x_tilt = plate.x_tilt
+        self.prev_y_tilt = plate.y_tilt
+        
+        drifting = distance > SKILL_DRIFT_THRESHOLD and ball.x * ball.vx + ball.y * ball.vy > 0
+        corrective = input_x * ball.x + input_y * ball.y < 0
+        
+        if self.drift_time is None:
+            if drifting and not corrective:
+                self.drift_time = 0
+        else:
+            self.drift_time += dt
+            if corrective:
+                self.correction_latency += SKILL_LATENCY_WEIGHT * (self.drift_time - self.correction_latency)
+                self.corrections += 1
+                self.drift_time = None
+            elif not drifting:
+                self.drift_time = None
+        
+    def get_skill(self):
+        latency = min(self.correction_latency / SKILL_LATENCY_REFERENCE, 1)
+        penalty = (SKILL_DISTANCE_FACTOR * self.mean_distance +
+                   SKILL_EDGE_FACTOR * self.edge_time +
+                   SKILL_LATENCY_FACTOR * latency)
+        return max(0, 1 - penalty)
+    
+    def get_state(self):
+        return {
+            'mean_distance': self.mean_distance,
+            'edge_time': self.edge_time,
+            'correction_latency': self.correction_latency,
+            'corrections': self.corrections,
+            'skill': self.get_skill()
+        }
 
 class Plate:
-    def __init__(self, is_left_plate=True):
+    def __init__(self, is_left_plate=True, layout=None):
         self.is_left_plate = is_left_plate
+        self.layout = layout
         self.reset()
         
     def reset(self):
@@ -177,9 +654,24 @@ class Plate:
             self.tilt_direction = math.degrees(math.atan2(self.y_tilt, self.x_tilt))
             if self.tilt_direction < 0:
                 self.tilt_direction += 360
+                
+    def get_input_bits(self, keys):
+        if self.is_left_plate:
+            up, down, left, right = K_w, K_s, K_a, K_d
+        else:
+            up, down, left, right = K_i, K_k, K_j, K_l
+        
+        bits = 0
+        if keys[up]: bits |= INPUT_UP
+        if keys[down]: bits |= INPUT_DOWN
+        if keys[left]: bits |= INPUT_LEFT
+        if keys[right]: bits |= INPUT_RIGHT
+        return bits
 
 class Game:
-    def __init__(self):
+    def __init__(self, adaptive_difficulty=ADAPTIVE_DIFFICULTY, state_feed=STATE_FEED, layout_path=None,
+                 ball_count=MULTI_BALL_COUNT, loss_fraction=BALL_LOSS_FRACTION, log_skill=LOG_SKILL,
+                 replace_stale_feed=False):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.FULLSCREEN)
         pygame.display.set_caption("Dual Plate Balancing Game")
         self.clock = pygame.time.Clock()
@@ -188,10 +680,34 @@ class Game:
         self.center_x_right = WINDOW_WIDTH // 2 + PLATES_HORIZONTAL_DISTANCE // 2
         self.center_y = WINDOW_HEIGHT // 2 + PLATES_VERTICAL_OFFSET
         
-        self.plate_left = Plate(is_left_plate=True)
-        self.plate_right = Plate(is_left_plate=False)
-        self.ball_left = Ball(0, 0)
-        self.ball_right = Ball(0, 0)
+        layout = load_plate_layout(layout_path) if layout_path else None
+        self.plate_left = Plate(is_left_plate=True, layout=layout)
+        self.plate_right = Plate(is_left_plate=False, layout=layout)
+        if ball_count > 1:
+            self.ball_left = BallGroup(ball_count, loss_fraction, layout)
+            self.ball_right = BallGroup(ball_count, loss_fraction, layout)
+        else:
+            self.ball_left = Ball(0, 0)
+            self.ball_right = Ball(0, 0)
+        
+        self.plate_views = [
+            (self.plate_left, self.ball_left, True, self.center_x_left),
+            (self.plate_right, self.ball_right, False, self.center_x_right)
+        ]
+        
+        self.trajectory_predictors = [TrajectoryPredictor() for _ in self.plate_views]
+        self.show_trajectory = False
+        
+        self.adaptive_difficulty = adaptive_difficulty
+        self.log_skill = log_skill or adaptive_difficulty
+        self.skill_estimators = [SkillEstimator() for _ in self.plate_views]
+        self.difficulty_level = 0
+        self.applied_level = 0
+        self.next_skill_log_time = 0
+        
+        self.state_feed = None
+        if state_feed:
+            self.state_feed = StateFeedWriter(len(self.plate_views), replace_stale=replace_stale_feed)
         
         self.state = GameState.NOT_STARTED
         
@@ -199,6 +715,9 @@ class Game:
         self.reference_font = pygame.font.Font(None, REFERENCE_FONT_SIZE)
         self.large_font = pygame.font.Font(None, MESSAGE_FONT_SIZE)
         
+        self.cache_plate_backgrounds = True
+        self.setup_plate_backgrounds()
+        
         self.game_time = 0
         self.current_gravity = INITIAL_GRAVITY
         self.current_rolling_resistance = INITIAL_ROLLING_RESISTANCE
@@ -209,6 +728,13 @@ class Game:
         self.plate_right.reset()
         self.ball_left.reset(0, 0)
         self.ball_right.reset(0, 0)
+        for predictor in self.trajectory_predictors:
+            predictor.reset()
+        for estimator in self.skill_estimators:
+            estimator.reset()
+        self.difficulty_level = 0
+        self.applied_level = 0
+        self.next_skill_log_time = 0
         self.state = GameState.NOT_STARTED
         
         self.game_time = 0
@@ -241,11 +767,113 @@ class Game:
             )
             self.current_max_speed = new_max_speed
 
+    def update_skill(self, dt):
+        for (plate, ball, is_left_plate, center_x), estimator in zip(self.plate_views,
+                                                                     self.skill_estimators):
+            if ball.is_in_play():
+                estimator.update(plate, ball, dt)
+        
+        if self.game_time >= self.next_skill_log_time:
+            self.next_skill_log_time = self.game_time + SKILL_LOG_INTERVAL
+            for (plate, ball, is_left_plate, center_x), estimator in zip(self.plate_views,
+                                                                         self.skill_estimators):
+                logger.info("t=%.1f plate=%s level=%.3f %s", self.game_time,
+                            "left" if is_left_plate else "right", self.difficulty_level,
+                            estimator.get_state())
+
+    def update_adaptive_difficulty(self, dt):
+        skill = sum(estimator.get_skill() for estimator in self.skill_estimators) / len(self.skill_estimators)
+        max_change = ADAPTIVE_LEVEL_RATE * dt
+        self.difficulty_level += max(-max_change, min(max_change, skill - self.difficulty_level))
+        
+        level = round(self.difficulty_level / ADAPTIVE_LEVEL_STEP) * ADAPTIVE_LEVEL_STEP
+        if level == self.applied_level:
+            return
+        self.applied_level = level
+        
+        self.current_gravity = INITIAL_GRAVITY + level * (MAX_GRAVITY - INITIAL_GRAVITY)
+        self.current_rolling_resistance = (INITIAL_ROLLING_RESISTANCE -
+                                           level * (INITIAL_ROLLING_RESISTANCE - MIN_ROLLING_RESISTANCE))
+        self.current_max_speed = INITIAL_MAX_SPEED + level * (ABSOLUTE_MAX_SPEED - INITIAL_MAX_SPEED)
+
+    def publish_state(self, keys):
+        plates = []
+        for plate, ball, is_left_plate, center_x in self.plate_views:
+            if ball.is_in_play():
+                ball_state = (ball.x, ball.y, ball.vx, ball.vy, ball.ax, ball.ay)
+            else:
+                ball_state = (math.nan,) * 6
+            plates.append(ball_state + (plate.tilt_magnitude, plate.tilt_direction,
+                                        plate.x_tilt, plate.y_tilt, plate.get_input_bits(keys)))
+        self.state_feed.publish(self.game_time, self.current_gravity,
+                                self.current_rolling_resistance, self.current_max_speed,
+                                self.state.value, plates)
+
+    def update_trajectories(self):
+        for (plate, ball, is_left_plate, center_x), predictor in zip(self.plate_views,
+                                                                     self.trajectory_predictors):
+            if not ball.is_in_play():
+                predictor.reset()
+                continue
+            predictor.update(plate, ball, self.current_gravity,
+                             self.current_rolling_resistance, self.current_max_speed)
+
+    def setup_plate_backgrounds(self):
+        plate_radius = int(PLATE_RADIUS * DISPLAY_SCALE)
+        area_width = PLATES_HORIZONTAL_DISTANCE
+        area_height = PLATE_AREA_TOP_MARGIN + 2 * plate_radius + PLATE_AREA_BOTTOM_MARGIN
+        
+        self.plate_area_center = (area_width // 2, PLATE_AREA_TOP_MARGIN + plate_radius)
+        self.plate_background_positions = []
+        self.plate_backgrounds = []
+        for plate, ball, is_left_plate, center_x in self.plate_views:
+            background = pygame.Surface((area_width, area_height))
+            background.fill(BLACK)
+            self.draw_plate_background(background, self.plate_area_center[0], self.plate_area_center[1],
+                                       plate, is_left_plate)
+            background.set_colorkey(BLACK, RLEACCEL)
+            self.plate_backgrounds.append(background)
+            self.plate_background_positions.append((center_x - self.plate_area_center[0],
+                                                    self.center_y - self.plate_area_center[1]))
+            
+    def shutdown(self):
+        if self.state_feed is not None:
+            self.state_feed.close()
+            self.state_feed = None
+        pygame.quit()
+
     def get_display_angle(self, actual_angle):
         return (actual_angle + 90) % 360
         
-    def draw_plate(self, center_x, center_y, plate, ball, is_left_plate):
-        pygame.draw.circle(self.screen, WHITE, 
+    def render_plate(self, index):
+        plate, ball, is_left_plate, center_x = self.plate_views[index]
+        if self.cache_plate_backgrounds:
+            self.screen.blit(self.plate_backgrounds[index], self.plate_background_positions[index])
+        else:
+            self.draw_plate_background(self.screen, center_x, self.center_y, plate, is_left_plate)
+        self.draw_plate(self.screen, center_x, self.center_y,
+                        plate, ball, is_left_plate, self.trajectory_predictors[index],
+                        self.skill_estimators[index])
+        
+    def draw_trajectory(self, target, center_x, center_y, predictor):
+        path = predictor.path
+        for i in range(TRAJECTORY_DOT_SPACING - 1, len(path), TRAJECTORY_DOT_SPACING):
+            x, y, vx, vy = path[i]
+            pygame.draw.circle(target, GHOST_COLOR,
+                               (center_x + int(x * DISPLAY_SCALE), center_y + int(y * DISPLAY_SCALE)),
+                               2)
+        
+        if predictor.exit_frame:
+            x, y, vx, vy = path[predictor.exit_frame - 1]
+            exit_x = center_x + int(x * DISPLAY_SCALE)
+            exit_y = center_y + int(y * DISPLAY_SCALE)
+            pygame.draw.circle(target, RED, (exit_x, exit_y), int(BALL_RADIUS * DISPLAY_SCALE) + 4, 2)
+            
+            label = self.status_font.render(f"{predictor.exit_frame / FPS:.2f}s", True, RED)
+            target.blit(label, label.get_rect(midbottom=(exit_x, exit_y - int(BALL_RADIUS * DISPLAY_SCALE) - 6)))
+        
+    def draw_plate_background(self, target, center_x, center_y, plate, is_left_plate):
+        pygame.draw.circle(target, WHITE, 
                            (center_x, center_y), 
                            int(PLATE_RADIUS * DISPLAY_SCALE), 
                            2)
@@ -254,25 +882,28 @@ class Game:
         title_surface = self.reference_font.render(title_text, True, WHITE)
         title_rect = title_surface.get_rect()
         title_rect.midbottom = (center_x, center_y - int(PLATE_RADIUS * DISPLAY_SCALE) - 30)
-        self.screen.blit(title_surface, title_rect)
+        target.blit(title_surface, title_rect)
         
         reference_angles = [15, 30, 45]
         for angle in reference_angles:
             radius = PLATE_RADIUS * (angle / MAX_TILT)
             draw_radius = int(radius * DISPLAY_SCALE)
-            pygame.draw.circle(self.screen, GREEN, (center_x, center_y), draw_radius, 1)
+            pygame.draw.circle(target, GREEN, (center_x, center_y), draw_radius, 1)
             
             label = f"{angle}°"
             text_x = center_x + int(draw_radius * math.cos(math.pi / 4))
             text_y = center_y - int(draw_radius * math.sin(math.pi / 4))
             
             text_surface = self.reference_font.render(label, True, GREEN)
-            self.screen.blit(text_surface, (text_x, text_y))
+            target.blit(text_surface, (text_x, text_y))
         
         for angle in range(0, 360, 90):
             end_x = center_x + int(PLATE_RADIUS * math.cos(math.radians(angle)) * DISPLAY_SCALE)
             end_y = center_y + int(PLATE_RADIUS * math.sin(math.radians(angle)) * DISPLAY_SCALE)
-            pygame.draw.line(self.screen, GREEN, (center_x, center_y), (end_x, end_y), 1)
+            pygame.draw.line(target, GREEN, (center_x, center_y), (end_x, end_y), 1)
+        
+        if plate.layout is not None:
+            plate.layout.draw(target, center_x, center_y)
         
         label_distance = (PLATE_RADIUS + 30) * DISPLAY_SCALE
         if is_left_plate:
@@ -293,8 +924,10 @@ class Game:
         for text, pos in labels.items():
             surface = self.reference_font.render(text, True, WHITE)
             rect = surface.get_rect(center=(int(pos[0]), int(pos[1])))
-            self.screen.blit(surface, rect)
+            target.blit(surface, rect)
         
+    def draw_plate(self, target, center_x, center_y, plate, ball, is_left_plate,
+                   predictor=None, estimator=None):
         if plate.tilt_magnitude > 0:
             arrow_length = PLATE_RADIUS * (plate.tilt_magnitude / MAX_TILT)
             arrow_length *= DISPLAY_SCALE
@@ -303,7 +936,7 @@ class Game:
             end_x = center_x + arrow_length * math.cos(angle_rad)
             end_y = center_y + arrow_length * math.sin(angle_rad)
             
-            pygame.draw.line(self.screen, YELLOW, 
+            pygame.draw.line(target, YELLOW, 
                              (center_x, center_y), 
                              (end_x, end_y), 3)
             
@@ -313,48 +946,62 @@ class Game:
             for offset in [-head_angle, head_angle]:
                 head_x = end_x - head_length * math.cos(angle_rad + offset)
                 head_y = end_y - head_length * math.sin(angle_rad + offset)
-                pygame.draw.line(self.screen, YELLOW,
+                pygame.draw.line(target, YELLOW,
                                  (end_x, end_y),
                                  (head_x, head_y), 3)
         
-        ball_screen_x = center_x + int(ball.x * DISPLAY_SCALE)
-        ball_screen_y = center_y + int(ball.y * DISPLAY_SCALE)
-        pygame.draw.circle(self.screen, RED, 
-                           (ball_screen_x, ball_screen_y), 
-                           int(BALL_RADIUS * DISPLAY_SCALE))
+        if self.show_trajectory and predictor is not None:
+            self.draw_trajectory(target, center_x, center_y, predictor)
+        
+        balls = ball.active if isinstance(ball, BallGroup) else [ball]
+        for drawn_ball in balls:
+            ball_screen_x = center_x + int(drawn_ball.x * DISPLAY_SCALE)
+            ball_screen_y = center_y + int(drawn_ball.y * DISPLAY_SCALE)
+            pygame.draw.circle(target, RED, 
+                               (ball_screen_x, ball_screen_y), 
+                               int(BALL_RADIUS * DISPLAY_SCALE))
         
         status_text = [
             f"Plate tilt magnitude: {plate.tilt_magnitude:.1f}°",
-            f"Plate tilt direction: {self.get_display_angle(plate.tilt_direction):.1f}°",
-            f"Distance from center: {ball.get_distance_from_center():.1f}px",
-            f"Distance to edge: {ball.get_distance_to_edge():.1f}px",
-            f"Ball speed: {ball.get_speed():.1f}px/frame"
+            f"Plate tilt direction: {self.get_display_angle(plate.tilt_direction):.1f}°"
         ]
         
+        if ball.is_in_play():
+            status_text += [
+                f"Distance from center: {ball.get_distance_from_center():.1f}px",
+                f"Distance to edge: {ball.get_distance_to_edge():.1f}px",
+                f"Ball speed: {ball.get_speed():.1f}px/frame"
+            ]
+        
+        if isinstance(ball, BallGroup):
+            status_text.append(f"Balls on plate: {len(ball.active)}/{len(ball.balls)}")
+        
         if self.state == GameState.RUNNING or self.state == GameState.PAUSED:
             status_text.append(f"Game time: {self.game_time:.1f}s")
         
+        if self.adaptive_difficulty and estimator is not None:
+            status_text.append(f"Skill estimate: {estimator.get_skill():.2f} (level {self.difficulty_level:.2f})")
+        
         y_offset = center_y + int(PLATE_RADIUS * DISPLAY_SCALE) + 20
         line_spacing = 22  
         if is_left_plate:
             x_offset = center_x - int(PLATE_RADIUS * DISPLAY_SCALE) - 10
             for text_line in status_text:
                 surface = self.status_font.render(text_line, True, WHITE)
-                self.screen.blit(surface, (x_offset, y_offset))
+                target.blit(surface, (x_offset, y_offset))
                 y_offset += line_spacing
         else:
             for text_line in status_text:
                 surface = self.status_font.render(text_line, True, WHITE)
                 x_offset = center_x + int(PLATE_RADIUS * DISPLAY_SCALE) - surface.get_width() + 10
-                self.screen.blit(surface, (x_offset, y_offset))
+                target.blit(surface, (x_offset, y_offset))
                 y_offset += line_spacing
                 
-    def draw(self):
+    def render(self):
         self.screen.fill(BLACK)
         
-        self.draw_plate(self.center_x_left, self.center_y, self.plate_left, self.ball_left, True)
-        
-        self.draw_plate(self.center_x_right, self.center_y, self.plate_right, self.ball_right, False)
+        for index in range(len(self.plate_views)):
+            self.render_plate(index)
         
         message_y_position = self.center_y  
         
@@ -371,6 +1018,8 @@ class Game:
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, message_y_position))
             self.screen.blit(text, text_rect)
         
+    def draw(self):
+        self.render()
         pygame.display.flip()
         
     def run(self):
@@ -383,7 +1032,7 @@ class Game:
             
             for event in pygame.event.get():
                 if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
-                    pygame.quit()
+                    self.shutdown()
                     sys.exit()
                 elif event.type == KEYDOWN:
                     if event.key == K_SPACE:
@@ -397,13 +1046,18 @@ class Game:
                             self.state = GameState.RUNNING
                     elif event.key == K_r and self.state == GameState.GAME_OVER:
                         self.reset()
+                    elif event.key == K_t:
+                        self.show_trajectory = not self.show_trajectory
             
             keys = pygame.key.get_pressed()
             
             if self.state == GameState.RUNNING:
                 self.game_time += dt
                 
-                self.update_difficulty()
+                if self.adaptive_difficulty:
+                    self.update_adaptive_difficulty(dt)
+                else:
+                    self.update_difficulty()
                 
                 self.plate_left.update(keys)
                 self.plate_right.update(keys)
@@ -415,12 +1069,199 @@ class Game:
                                       self.current_rolling_resistance, 
                                       self.current_max_speed)
                 
+                if self.log_skill:
+                    self.update_skill(dt)
+                
                 if not left_ball_ok or not right_ball_ok:
                     self.state = GameState.GAME_OVER
             
+            if self.state_feed is not None:
+                self.publish_state(keys)
+            
+            if self.show_trajectory:
+                self.update_trajectories()
+            
             self.draw()
             self.clock.tick(FPS)
 
+def benchmark_rendering(frames=300, plate_counts=(1, 2, 4, 8), layout_path=None):
+    game = Game(layout_path=layout_path)
+    game.state = GameState.RUNNING
+    game.plate_left.apply_random_tilt()
+    game.plate_right.apply_random_tilt()
+    layout = game.plate_left.layout
+    
+    def time_render():
+        results = []
+        for cached in (False, True):
+            game.cache_plate_backgrounds = cached
+            game.render()
+            start = time.perf_counter()
+            for _ in range(frames):
+                game.render()
+            results.append((time.perf_counter() - start) * 1000 / frames)
+        return results
+    
+    print(f"Plate area: {PLATES_HORIZONTAL_DISTANCE}x{game.plate_backgrounds[0].get_height()}px, "
+          f"layout: {layout_path or 'none'}, frame budget {1000 / FPS:.2f}ms, display flip excluded")
+    print(f"{'Plates':>12} {'Direct draw (baseline)':>24} {'Cached background':>19}")
+    
+    results = time_render()
+    label = f"2 @{WINDOW_WIDTH}x{WINDOW_HEIGHT}"
+    print(f"{label:>12} {results[0]:>22.2f}ms {results[1]:>17.2f}ms")
+    
+    for count in plate_counts:
+        game.plate_views = []
+        for i in range(count):
+            plate = Plate(is_left_plate=i % 2 == 0, layout=layout)
+            plate.apply_random_tilt()
+            center_x = PLATES_HORIZONTAL_DISTANCE // 2 + i * PLATES_HORIZONTAL_DISTANCE
+            game.plate_views.append((plate, Ball(0, 0), i % 2 == 0, center_x))
+        game.trajectory_predictors = [TrajectoryPredictor() for _ in game.plate_views]
+        game.skill_estimators = [SkillEstimator() for _ in game.plate_views]
+        game.screen = pygame.Surface((count * PLATES_HORIZONTAL_DISTANCE, WINDOW_HEIGHT))
+        game.setup_plate_backgrounds()
+        
+        results = time_render()
+        print(f"{count:>12} {results[0]:>22.2f}ms {results[1]:>17.2f}ms")
+    
+    game.shutdown()
+
+def benchmark_layout(frames=20000, feature_counts=(0, 10, 100, 300, 1000)):
+    forces = (0.004, 0.003, 0.014, 0.075)
+    
+    print(f"{'Features':>8} {'Grid':>12} {'Brute force':>14}")
+    for count in feature_counts:
+        rng = random.Random(count)
+        features = []
+        while len(features) < count:
+            x = rng.uniform(-PLATE_RADIUS, PLATE_RADIUS)
+            y = rng.uniform(-PLATE_RADIUS, PLATE_RADIUS)
+            if math.sqrt(x*x + y*y) > PLATE_RADIUS - BALL_RADIUS:
+                continue
+            kind = rng.random()
+            if kind < 0.4:
+                features.append(Bumper(x, y, rng.uniform(10, 30)))
+            elif kind < 0.8:
+                angle = rng.uniform(0, 2 * math.pi)
+                length = rng.uniform(20, 80)
+                features.append(Wall(x, y, x + length * math.cos(angle), y + length * math.sin(angle)))
+            else:
+                features.append(Hole(x, y, rng.uniform(10, 25)))
+        layout = PlateLayout(features)
+        
+        def brute_force(x, y, vx, vy):
+            for feature in features:
+                state = feature.collide(x, y, vx, vy)
+                if state is None:
+                    return None
+                x, y, vx, vy = state
+            return x, y, vx, vy
+        
+        results = []
+        for resolve in (layout.resolve, brute_force):
+            respawn = random.Random(0)
+            x, y, vx, vy = 0.0, 0.0, 2.0, 1.0
+            start = time.perf_counter()
+            for _ in range(frames):
+                x, y, vx, vy, ax, ay = step_ball(x, y, vx, vy, forces, INITIAL_MAX_SPEED)
+                state = resolve(x, y, vx, vy) if is_on_plate(x, y) else None
+                if state is None:
+                    x, y, vx, vy = respawn.uniform(-500, 500), respawn.uniform(-500, 500), 2.0, -1.0
+                else:
+                    x, y, vx, vy = state
+            results.append((time.perf_counter() - start) * 1e6 / frames)
+        
+        print(f"{count:>8} {results[0]:>10.2f}us {results[1]:>12.2f}us")
+
+def benchmark_balls(frames=300, ball_counts=(1, 10, 50, 100, 200, 400)):
+    plate = Plate()
+    plate.tilt_magnitude = 3
+    
+    def pairwise(balls):
+        for i in range(len(balls)):
+            for j in range(i + 1, len(balls)):
+                collide_balls(balls[i], balls[j])
+    
+    print(f"{'Balls':>6} {'Spatial hash':>14} {'Pairwise':>12}")
+    for count in ball_counts:
+        results = []
+        for broad_phase in (None, pairwise):
+            group = BallGroup(count)
+            if broad_phase is not None:
+                group.resolve_collisions = broad_phase
+            rng = random.Random(count)
+            for ball in group.balls:
+                ball.vx = rng.uniform(-3, 3)
+                ball.vy = rng.uniform(-3, 3)
+            
+            start = time.perf_counter()
+            for frame in range(frames):
+                plate.tilt_direction = (frame * 3) % 360
+                group.update(plate, INITIAL_GRAVITY, INITIAL_ROLLING_RESISTANCE, INITIAL_MAX_SPEED)
+            results.append((time.perf_counter() - start) * 1000 / frames)
+        
+        print(f"{count:>6} {results[0]:>12.3f}ms {results[1]:>10.3f}ms  (frame budget {1000 / FPS:.2f}ms)")
+
+def benchmark_skill_estimator(frames=100000):
+    plate = Plate()
+    plate.apply_random_tilt()
+    ball = Ball(0, 0)
+    estimator = SkillEstimator()
+    dt = 1.0 / FPS
+    
+    states = []
+    for i in range(1000):
+        plate.x_tilt = TILT_BEGINNING * math.cos(i * 0.05)
+        plate.y_tilt = TILT_BEGINNING * math.sin(i * 0.07)
+        ball.x = 800 * math.sin(i * 0.01)
+        ball.y = 800 * math.cos(i * 0.013)
+        ball.vx = 3 * math.cos(i * 0.02)
+        ball.vy = 3 * math.sin(i * 0.03)
+        states.append((plate.x_tilt, plate.y_tilt, ball.x, ball.y, ball.vx, ball.vy))
+    
+    start = time.perf_counter()
+    for i in range(frames):
+        plate.x_tilt, plate.y_tilt, ball.x, ball.y, ball.vx, ball.vy = states[i % len(states)]
+        estimator.update(plate, ball, dt)
+    per_update = (time.perf_counter() - start) * 1e6 / frames
+    
+    print(f"Skill estimator update: {per_update:.2f}us/plate/frame")
+    print(f"Share of frame budget: {per_update / (1e6 / FPS) * 100:.4f}% per plate")
+    print(f"Final state: {estimator.get_state()}")
+
 if __name__ == "__main__":
-    game = Game()
+    if "--benchmark-render" in sys.argv:
+        layout_path = None
+        if "--layout" in sys.argv:
+            layout_path = sys.argv[sys.argv.index("--layout") + 1]
+        benchmark_rendering(layout_path=layout_path)
+        sys.exit()
+    if "--benchmark-skill" in sys.argv:
+        benchmark_skill_estimator()
+        sys.exit()
+    if "--benchmark-layout" in sys.argv:
+        benchmark_layout()
+        sys.exit()
+    if "--benchmark-balls" in sys.argv:
+        benchmark_balls()
+        sys.exit()
+    adaptive = ADAPTIVE_DIFFICULTY or "--adaptive" in sys.argv
+    log_skill = LOG_SKILL or "--log-skill" in sys.argv
+    if adaptive or log_skill:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    state_feed = STATE_FEED or "--state-feed" in sys.argv
+    replace_stale_feed = "--replace-stale-feed" in sys.argv
+    layout_path = None
+    if "--layout" in sys.argv:
+        layout_path = sys.argv[sys.argv.index("--layout") + 1]
+    ball_count = MULTI_BALL_COUNT
+    if "--balls" in sys.argv:
+        ball_count = int(sys.argv[sys.argv.index("--balls") + 1])
+    loss_fraction = BALL_LOSS_FRACTION
+    if "--loss-fraction" in sys.argv:
+        loss_fraction = float(sys.argv[sys.argv.index("--loss-fraction") + 1])
+    game = Game(adaptive_difficulty=adaptive, state_feed=state_feed, layout_path=layout_path,
+                ball_count=ball_count, loss_fraction=loss_fraction, log_skill=log_skill,
+                replace_stale_feed=replace_stale_feed)
     game.run()
\ No newline at end of file
@@ -0,0 +1,241 @@
+import struct
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory, resource_tracker
+
+STATE_FEED_NAME = "ams_balance_state"
+MAX_FEED_PLATES = 8
+READ_RETRIES = 100
+LIVE_CHECK_INTERVAL = 0.25
+
+SEQUENCE = struct.Struct("<Q")
+HEADER = struct.Struct("<Qq4dII")
+PLATE = struct.Struct("<10dI4x")
+
+HEADER_OFFSET = SEQUENCE.size
+PLATES_OFFSET = HEADER_OFFSET + HEADER.size
+FEED_SIZE = PLATES_OFFSET + MAX_FEED_PLATES * PLATE.size
+
+FeedGame = namedtuple("FeedGame", [
+    "frame", "publish_time_ns", "game_time",
+    "gravity", "rolling_resistance", "max_speed", "game_state", "plate_count"
+])
+FeedPlate = namedtuple("FeedPlate", [
+    "ball_x", "ball_y", "ball_vx", "ball_vy", "ball_ax", "ball_ay",
+    "tilt_magnitude", "tilt_direction", "x_tilt", "y_tilt", "input_bits"
+])
+FeedFrame = namedtuple("FeedFrame", ["sequence", "game", "plates"])
+
+INPUT_UP = 1
+INPUT_DOWN = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+
+_created_feeds = set()
+
+def _attach(name, shared_tracker):
+    if shared_tracker or name in _created_feeds:
+        return shared_memory.SharedMemory(name=name)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+def _is_live(shm):
+    if shm.size < SEQUENCE.size:
+        return False
+    sequence = SEQUENCE.unpack_from(shm.buf, 0)[0]
+    time.sleep(LIVE_CHECK_INTERVAL)
+    return SEQUENCE.unpack_from(shm.buf, 0)[0] != sequence
+
+class StateFeedWriter:
+    def __init__(self, plate_count, name=STATE_FEED_NAME, replace_stale=False):
+        if plate_count > MAX_FEED_PLATES:
+            raise ValueError(f"State feed holds at most {MAX_FEED_PLATES} plates, got {plate_count}")
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=FEED_SIZE)
+        except FileExistsError:
+            if name in _created_feeds:
+                raise FileExistsError(f"State feed {name!r} is already published by a writer in this process")
+
+            existing = _attach(name, shared_tracker=False)
+            size = existing.size
+            live = _is_live(existing)
+            existing.close()
+
+            if live:
+                raise FileExistsError(f"State feed {name!r} is being published by another writer; "
+                                      f"close the other game instance or use a different feed name")
+            if not replace_stale:
+                if size < FEED_SIZE:
+                    raise ValueError(f"Stale state feed {name!r} is {size} bytes but {FEED_SIZE} are needed; "
+                                     f"remove it or pass replace_stale=True")
+                raise FileExistsError(f"Stale state feed {name!r} already exists; "
+                                      f"remove it or pass replace_stale=True")
+
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=FEED_SIZE)
+
+        _created_feeds.add(name)
+        self.name = name
+        self.buf = self.shm.buf
+        self.plate_count = plate_count
+        self.sequence = 0
+        self.frame = 0
+        SEQUENCE.pack_into(self.buf, 0, self.sequence)
+
+    def publish(self, game_time, gravity, rolling_resistance, max_speed, game_state, plates):
+        buf = self.buf
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, 0, self.sequence)
+
+        HEADER.pack_into(buf, HEADER_OFFSET, self.frame, time.monotonic_ns(), game_time,
+                         gravity, rolling_resistance, max_speed, game_state, self.plate_count)
+        offset = PLATES_OFFSET
+        for plate in plates:
+            PLATE.pack_into(buf, offset, *plate)
+            offset += PLATE.size
+
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, 0, self.sequence)
+        self.frame += 1
+
+    def close(self):
+        if self.shm is None:
+            return
+        self.buf.release()
+        self.buf = None
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+        _created_feeds.discard(self.name)
+
+class StateFeedReader:
+    def __init__(self, name=STATE_FEED_NAME, shared_tracker=False):
+        self.shm = _attach(name, shared_tracker)
+        self.buf = self.shm.buf
+        self.last_sequence = 0
+        self.retries = 0
+
+    def read(self):
+        buf = self.buf
+        for _ in range(READ_RETRIES):
+            sequence = SEQUENCE.unpack_from(buf, 0)[0]
+            if sequence == 0 or sequence & 1:
+                self.retries += 1
+                continue
+
+            game = FeedGame._make(HEADER.unpack_from(buf, HEADER_OFFSET))
+            plates = [FeedPlate._make(PLATE.unpack_from(buf, PLATES_OFFSET + i * PLATE.size))
+                      for i in range(min(game.plate_count, MAX_FEED_PLATES))]
+
+            if SEQUENCE.unpack_from(buf, 0)[0] == sequence:
+                self.last_sequence = sequence
+                return FeedFrame(sequence, game, plates)
+            self.retries += 1
+        return None
+
+    def poll(self):
+        if SEQUENCE.unpack_from(self.buf, 0)[0] == self.last_sequence:
+            return None
+        return self.read()
+
+    def close(self):
+        if self.shm is None:
+            return
+        self.buf.release()
+        self.buf = None
+        self.shm.close()
+        self.shm = None
+
+def _staleness_reader(name, duration, poll_interval, results):
+    reader = StateFeedReader(name, shared_tracker=True)
+    staleness = []
+    frames_seen = 0
+    torn = 0
+    last_frame = None
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        frame = reader.poll()
+        if frame is not None:
+            staleness.append((time.monotonic_ns() - frame.game.publish_time_ns) / 1e6)
+            if any(plate.ball_x != frame.game.frame for plate in frame.plates):
+                torn += 1
+            if frame.game.frame != last_frame:
+                frames_seen += 1
+                last_frame = frame.game.frame
+        time.sleep(poll_interval)
+    reader.close()
+
+    staleness.sort()
+    results.put({
+        'reads': len(staleness),
+        'frames_seen': frames_seen,
+        'retries': reader.retries,
+        'torn': torn,
+        'median_ms': staleness[len(staleness) // 2] if staleness else 0,
+        'p99_ms': staleness[int(len(staleness) * 0.99)] if staleness else 0,
+        'max_ms': staleness[-1] if staleness else 0
+    })
+
+def benchmark_state_feed(duration=5.0, fps=60, poll_rate=250, plate_count=2):
+    import multiprocessing
+
+    name = f"{STATE_FEED_NAME}_benchmark"
+    writer = StateFeedWriter(plate_count, name)
+    plates = [[0, 2.0, 0.5, -0.5, 0.01, 0.02, 5.0, 90.0, 0.0, 5.0, INPUT_UP]
+              for _ in range(plate_count)]
+    writer.publish(0, 0.08, 0.18, 6.0, 1, plates)
+
+    results = multiprocessing.Queue()
+    reader_process = multiprocessing.Process(target=_staleness_reader,
+                                             args=(name, duration, 1.0 / poll_rate, results))
+    reader_process.start()
+
+    publish_times = []
+    start = time.monotonic()
+    next_frame = start
+    while time.monotonic() - start < duration + 0.5:
+        for plate in plates:
+            plate[0] = writer.frame
+        t = time.perf_counter()
+        writer.publish(time.monotonic() - start, 0.08, 0.18, 6.0, 1, plates)
+        publish_times.append(time.perf_counter() - t)
+        next_frame += 1.0 / fps
+        time.sleep(max(0, next_frame - time.monotonic()))
+
+    reader_stats = results.get()
+    reader_process.join()
+    writer.close()
+
+    publish_times.sort()
+    print(f"Published {len(publish_times)} frames at {fps}fps, {plate_count} plates, {FEED_SIZE} bytes")
+    print(f"Publish overhead: median {publish_times[len(publish_times) // 2] * 1e6:.2f}us, "
+          f"max {publish_times[-1] * 1e6:.2f}us")
+    print(f"Reader at {poll_rate}Hz: {reader_stats['reads']} reads, "
+          f"{reader_stats['frames_seen']} distinct frames, {reader_stats['retries']} retries, {reader_stats['torn']} torn")
+    print(f"Staleness: median {reader_stats['median_ms']:.2f}ms, p99 {reader_stats['p99_ms']:.2f}ms, "
+          f"max {reader_stats['max_ms']:.2f}ms")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_state_feed()
+        sys.exit()
+
+    reader = StateFeedReader()
+    try:
+        while True:
+            frame = reader.poll()
+            if frame is not None:
+                print(frame)
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()